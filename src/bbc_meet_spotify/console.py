@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import typer
 from loguru import logger
 from spotipy import Spotify
 
 from bbc_meet_spotify.playlist_parsing import PlaylistChoices
 from bbc_meet_spotify import BBCSounds, Spotify, __version__
+from bbc_meet_spotify.spotify import load_accounts
 
 
 def version_callback(value: bool):
@@ -31,14 +34,41 @@ def console(
     bbc_sounds = BBCSounds(playlist_key.value, date_prefix, custom_playlist_name)
 
     music = bbc_sounds.get_music()
-    spotify = Spotify()
+    # authorise every account up front, as token prompts need the command line
+    spotify_accounts = [Spotify(account) for account in load_accounts()]
     if not music:
         logger.info("No new music to add to the playlist")
         return
+    # track ids don't depend on the account, so only search spotify once
+    spotify = spotify_accounts[0]
     if bbc_sounds.type == "album":
-        spotify.add_albums(bbc_sounds.playlist_suffix, music, date_prefix, public_playlist)
+        music_type = "albums"
+        song_ids = spotify.get_album_song_ids(music)
     else:
-        spotify.add_songs(bbc_sounds.playlist_suffix, music, date_prefix, public_playlist)
+        music_type = "songs"
+        song_ids = spotify.get_song_ids(music)
+
+    with ThreadPoolExecutor(max_workers=len(spotify_accounts)) as executor:
+        futures = {
+            account: executor.submit(account.add_song_ids, bbc_sounds.playlist_suffix, song_ids,
+                                     date_prefix, public_playlist)
+            for account in spotify_accounts
+        }
+    errors = []
+    updated_users = []
+    for account, future in futures.items():
+        try:
+            future.result()
+            updated_users.append(account.username)
+        except Exception as error:
+            logger.error(f"Failed to update playlist for user '{account.username}': {error!r}")
+            errors.append(error)
+    if errors:
+        if updated_users:
+            logger.warning(f"Playlist was still updated for users {updated_users}, "
+                           f"but playlist history has not been saved")
+        raise errors[0]
+    spotify.log_music_not_found(music_type)
     bbc_sounds.write_playlist_history(music)
 
 
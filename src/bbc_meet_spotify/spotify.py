@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 
 import spotipy
 import toml
@@ -10,12 +10,42 @@ from loguru import logger
 from spotipy import util
 
 
+# maximum number of tracks spotify accepts in a single add tracks request
+TRACKS_PER_REQUEST = 100
+ACCOUNT_KEYS = ("username", "client_id", "client_secret")
+
+
+def load_accounts(config_path: Path = Path("./config.toml")) -> List[Dict[str, str]]:
+    """
+    Load spotify account configurations.
+    Multiple accounts can be defined as an array of `[[accounts]]` tables,
+    otherwise the top level config is used as a single account
+    :param config_path: path to the config toml
+    :raises ValueError: if no accounts are configured or an account is missing required fields
+    :return: list of account configurations
+    """
+    config = toml.load(config_path)
+    accounts = config.get("accounts", [config])
+    if not accounts:
+        raise ValueError(f"No spotify accounts configured in {config_path}")
+    for index, account in enumerate(accounts):
+        missing = [key for key in ACCOUNT_KEYS if key not in account]
+        if missing:
+            raise ValueError(f"Spotify account {index + 1} in {config_path} is missing: {', '.join(missing)}")
+    return accounts
+
+
 class Spotify:
-    def __init__(self):
-        """Save class data and set up spotify API"""
-        config = toml.load(Path("./config.toml"))
-        token = self.get_spotify_token(config)
-        self.username = config["username"]
+    def __init__(self, account: Optional[Dict[str, str]] = None):
+        """
+        Save class data and set up spotify API
+        :param account: account configuration, if not given then the first account in config.toml is used
+        """
+        if account is None:
+            account = load_accounts()[0]
+        token = self.get_spotify_token(account)
+        self.username = account["username"]
+        # each account has its own client, so its own session and rate limit retries
         self.spotify = spotipy.Spotify(auth=token)
         self.music_not_found = []
 
@@ -26,13 +56,27 @@ class Spotify:
         :param song_ids: list of song ids
         :return:
         """
-        playlist_info = self.spotify.user_playlist(self.username, playlist_id, "tracks")
-        existing_songs = [x["track"]["id"] for x in playlist_info["tracks"]["items"]]
-        new_song_ids = [song_id for song_id in song_ids if song_id not in existing_songs]
-        if new_song_ids:
-            self.spotify.user_playlist_add_tracks(self.username, playlist_id, new_song_ids)
-        else:
-            logger.info("No new music to add to the playlist")
+        existing_songs = set(self.get_playlist_song_ids(playlist_id))
+        new_song_ids = list(dict.fromkeys(song_id for song_id in song_ids if song_id not in existing_songs))
+        if not new_song_ids:
+            logger.info(f"No new music to add to the playlist for user '{self.username}'")
+            return
+        for start in range(0, len(new_song_ids), TRACKS_PER_REQUEST):
+            self.spotify.user_playlist_add_tracks(self.username, playlist_id,
+                                                  new_song_ids[start:start + TRACKS_PER_REQUEST])
+
+    def get_playlist_song_ids(self, playlist_id: str) -> List[str]:
+        """
+        Get the ids of all songs currently in a playlist, following pagination
+        :param playlist_id: id for playlist
+        :return: list of song ids
+        """
+        tracks = self.spotify.user_playlist(self.username, playlist_id, "tracks")["tracks"]
+        song_ids = [x["track"]["id"] for x in tracks["items"] if x["track"]]
+        while tracks["next"]:
+            tracks = self.spotify.next(tracks)
+            song_ids.extend(x["track"]["id"] for x in tracks["items"] if x["track"])
+        return song_ids
 
 
     @staticmethod
@@ -84,21 +128,47 @@ class Spotify:
         song_ids = [self._get_song_id(song) for song in songs]
         return list(filter(None, song_ids))
 
-    def add_albums(self, playlist_name: str, albums: Set[Music], add_date_prefix=True, public_playlist=True) -> None:
-        playlist_id = self.create_playlist(playlist_name, add_date_prefix, public_playlist)
-        album_ids = []
+    def get_album_song_ids(self, albums: Set[Music]) -> List[str]:
+        """
+        Convert all albums into the song ids of their tracks, failed conversions will be removed
+        :param albums: albums to be converted
+        :return: list of song ids from spotify
+        """
+        song_ids = []
         for album in albums:
-            album_ids.extend(self._query_spotify_album_tracks(album))
-            self.add_music_to_playlist(playlist_id, album_ids)
+            song_ids.extend(self._query_spotify_album_tracks(album))
+        return song_ids
 
+    def add_song_ids(self, playlist_name: str, song_ids: List[str], add_date_prefix=True,
+                     public_playlist=True) -> None:
+        """
+        Add already resolved song ids to the playlist, creating it if required
+        :param playlist_name: name of the playlist to be used or created
+        :param song_ids: spotify song ids to be added
+        :param add_date_prefix: If true, add date prefix to playlist
+        :param public_playlist: If true, make playlist public
+        """
+        playlist_id = self.create_playlist(playlist_name, add_date_prefix, public_playlist)
+        self.add_music_to_playlist(playlist_id, song_ids)
+
+    def log_music_not_found(self, music_type: str = "songs") -> None:
+        """
+        Log any music which couldn't be found on spotify
+        :param music_type: type of music for the message, e.g. songs or albums
+        """
         message_base = "All done!"
         if self.music_not_found:
             not_found = "\n\t".join(self.music_not_found)
             logger.info(f"{message_base}\n"
-                        f"Couldn't find the following albums,  you'll have to do this manually for now 😥\n\t"
+                        f"Couldn't find the following {music_type},  you'll have to do this manually for now 😥\n\t"
                         f"{not_found}")
         else:
-            logger.info(f"{message_base} No albums need to be added manually 🥳")
+            logger.info(f"{message_base} No {music_type} need to be added manually 🥳")
+
+    def add_albums(self, playlist_name: str, albums: Set[Music], add_date_prefix=True, public_playlist=True) -> None:
+        song_ids = self.get_album_song_ids(albums)
+        self.add_song_ids(playlist_name, song_ids, add_date_prefix, public_playlist)
+        self.log_music_not_found("albums")
 
     def add_songs(self, playlist_name: str, songs: Set[Music], add_date_prefix=True, public_playlist=True) -> None:
         """
@@ -108,18 +178,9 @@ class Spotify:
         :param add_date_prefix: If true, add date prefix to playlist
         :param public_playlist: If true, make playlist public
         """
-        playlist_id = self.create_playlist(playlist_name, add_date_prefix, public_playlist)
         song_ids = self.get_song_ids(songs)
-        self.add_music_to_playlist(playlist_id, song_ids)
-
-        message_base = "All done!"
-        if self.music_not_found:
-            not_found = "\n\t".join(self.music_not_found)
-            logger.info(f"{message_base}\n"
-                        f"Couldn't find the following songs,  you'll have to do this manually for now 😥\n\t"
-                        f"{not_found}")
-        else:
-            logger.info(f"{message_base} No songs need to be added manually 🥳")
+        self.add_song_ids(playlist_name, song_ids, add_date_prefix, public_playlist)
+        self.log_music_not_found("songs")
 
     def _query_spotify_track(self, artist: str, song_title: str) -> str:
         """
@@ -11,42 +11,74 @@ def test_invalid_playlist_type():
         pass
 
 
+@patch("bbc_meet_spotify.console.load_accounts", return_value=[{"username": "user.name"}])
 @patch("bbc_meet_spotify.console.BBCSounds")
 @patch("bbc_meet_spotify.console.Spotify")
-def test_add_songs(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock):
+def test_add_songs(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock, _):
     mock_bbc_sounds_instance = mock_bbc_sounds.return_value
     mock_spotify_instance = mock_spotify.return_value
     music = {Music("artist", "title")}
+    song_ids = ["song_id"]
     mock_bbc_sounds_instance.get_music.return_value = music
+    mock_spotify_instance.get_song_ids.return_value = song_ids
     playlist_name = "suffix"
     mock_bbc_sounds_instance.playlist_suffix = playlist_name
     console(PlaylistChoices("six_music"))
     mock_bbc_sounds_instance.get_music.assert_called_once()
-    mock_spotify_instance.add_albums.assert_not_called()
-    mock_spotify_instance.add_songs.assert_called_with(playlist_name, music, ANY, ANY)
+    mock_spotify_instance.get_album_song_ids.assert_not_called()
+    mock_spotify_instance.get_song_ids.assert_called_once_with(music)
+    mock_spotify_instance.add_song_ids.assert_called_with(playlist_name, song_ids, ANY, ANY)
     mock_bbc_sounds_instance.write_playlist_history.assert_called_with(music)
 
 
+@patch("bbc_meet_spotify.console.load_accounts", return_value=[{"username": "user.name"}])
 @patch("bbc_meet_spotify.console.BBCSounds")
 @patch("bbc_meet_spotify.console.Spotify")
-def test_add_albums(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock):
+def test_add_albums(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock, _):
     mock_bbc_sounds_instance = mock_bbc_sounds.return_value
     mock_spotify_instance = mock_spotify.return_value
     music = {Music("artist", "title")}
+    song_ids = ["song_id"]
     mock_bbc_sounds_instance.get_music.return_value = music
+    mock_spotify_instance.get_album_song_ids.return_value = song_ids
     mock_bbc_sounds_instance.type = "album"
     playlist_name = "suffix"
     mock_bbc_sounds_instance.playlist_suffix = playlist_name
     console(PlaylistChoices("six_music"))
     mock_bbc_sounds_instance.get_music.assert_called_once()
-    mock_spotify_instance.add_albums.assert_called_with(playlist_name, music, ANY, ANY)
-    mock_spotify_instance.add_songs.assert_not_called()
+    mock_spotify_instance.get_album_song_ids.assert_called_once_with(music)
+    mock_spotify_instance.get_song_ids.assert_not_called()
+    mock_spotify_instance.add_song_ids.assert_called_with(playlist_name, song_ids, ANY, ANY)
     mock_bbc_sounds_instance.write_playlist_history.assert_called_with(music)
 
 
+@patch("bbc_meet_spotify.console.load_accounts",
+       return_value=[{"username": "first.user"}, {"username": "second.user"}])
 @patch("bbc_meet_spotify.console.BBCSounds")
 @patch("bbc_meet_spotify.console.Spotify")
-def test_exits_when_no_new_music(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock):
+def test_songs_resolved_once_for_multiple_accounts(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock, _):
+    first_account, second_account = MagicMock(), MagicMock()
+    mock_spotify.side_effect = [first_account, second_account]
+    mock_bbc_sounds_instance = mock_bbc_sounds.return_value
+    music = {Music("artist", "title")}
+    song_ids = ["song_id"]
+    mock_bbc_sounds_instance.get_music.return_value = music
+    first_account.get_song_ids.return_value = song_ids
+    playlist_name = "suffix"
+    mock_bbc_sounds_instance.playlist_suffix = playlist_name
+    console(PlaylistChoices("six_music"))
+    mock_bbc_sounds_instance.get_music.assert_called_once()
+    first_account.get_song_ids.assert_called_once_with(music)
+    second_account.get_song_ids.assert_not_called()
+    first_account.add_song_ids.assert_called_once_with(playlist_name, song_ids, ANY, ANY)
+    second_account.add_song_ids.assert_called_once_with(playlist_name, song_ids, ANY, ANY)
+    mock_bbc_sounds_instance.write_playlist_history.assert_called_once_with(music)
+
+
+@patch("bbc_meet_spotify.console.load_accounts", return_value=[{"username": "user.name"}])
+@patch("bbc_meet_spotify.console.BBCSounds")
+@patch("bbc_meet_spotify.console.Spotify")
+def test_exits_when_no_new_music(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock, _):
     mock_bbc_sounds_instance = mock_bbc_sounds.return_value
     mock_spotify_instance = mock_spotify.return_value
     music = []
@@ -55,6 +87,25 @@ def test_exits_when_no_new_music(mock_spotify: MagicMock, mock_bbc_sounds: Magic
     mock_bbc_sounds_instance.playlist_suffix = playlist_name
     console(PlaylistChoices("six_music"))
     mock_bbc_sounds_instance.get_music.assert_called_once()
-    mock_spotify_instance.add_albums.assert_not_called()
-    mock_spotify_instance.add_songs.assert_not_called()
+    mock_spotify_instance.get_song_ids.assert_not_called()
+    mock_spotify_instance.get_album_song_ids.assert_not_called()
+    mock_spotify_instance.add_song_ids.assert_not_called()
+    mock_bbc_sounds_instance.write_playlist_history.assert_not_called()
+
+
+@patch("bbc_meet_spotify.console.load_accounts",
+       return_value=[{"username": "first.user"}, {"username": "second.user"}])
+@patch("bbc_meet_spotify.console.BBCSounds")
+@patch("bbc_meet_spotify.console.Spotify")
+def test_failed_account_does_not_stop_other_accounts(mock_spotify: MagicMock, mock_bbc_sounds: MagicMock, _):
+    first_account, second_account = MagicMock(), MagicMock()
+    first_account.username, second_account.username = "first.user", "second.user"
+    first_account.add_song_ids.side_effect = RuntimeError("rate limited")
+    mock_spotify.side_effect = [first_account, second_account]
+    mock_bbc_sounds_instance = mock_bbc_sounds.return_value
+    mock_bbc_sounds_instance.get_music.return_value = {Music("artist", "title")}
+    # console is wrapped in logger.catch, so the re-raised error is logged rather than propagated
+    console(PlaylistChoices("six_music"))
+    second_account.add_song_ids.assert_called_once()
+    first_account.log_music_not_found.assert_not_called()
     mock_bbc_sounds_instance.write_playlist_history.assert_not_called()
@@ -0,0 +1,71 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from bbc_meet_spotify.spotify import Spotify, load_accounts
+
+ACCOUNT = {"username": "user.name", "client_id": "client", "client_secret": "secret"}
+
+
+@pytest.fixture
+def spotify() -> Spotify:
+    with patch("bbc_meet_spotify.spotify.util.prompt_for_user_token", return_value="token"), \
+            patch("bbc_meet_spotify.spotify.spotipy.Spotify") as mock_client:
+        spotify = Spotify(ACCOUNT)
+    assert spotify.spotify is mock_client.return_value
+    return spotify
+
+
+def playlist_page(song_ids, next_page=None) -> dict:
+    return {"items": [{"track": {"id": song_id}} for song_id in song_ids], "next": next_page}
+
+
+def test_load_single_account(tmp_path):
+    config = tmp_path / "config.toml"
+    config.write_text('client_id = "client"\nclient_secret = "secret"\nusername = "user.name"\n')
+    assert load_accounts(config) == [ACCOUNT]
+
+
+def test_load_multiple_accounts(tmp_path):
+    config = tmp_path / "config.toml"
+    config.write_text('[[accounts]]\nclient_id = "client"\nclient_secret = "secret"\nusername = "user.name"\n'
+                      '[[accounts]]\nclient_id = "other"\nclient_secret = "other"\nusername = "other.user"\n')
+    accounts = load_accounts(config)
+    assert [account["username"] for account in accounts] == ["user.name", "other.user"]
+
+
+def test_load_no_accounts(tmp_path):
+    config = tmp_path / "config.toml"
+    config.write_text("accounts = []\n")
+    with pytest.raises(ValueError, match="No spotify accounts configured"):
+        load_accounts(config)
+
+
+def test_load_account_missing_keys(tmp_path):
+    config = tmp_path / "config.toml"
+    config.write_text('[[accounts]]\nusername = "user.name"\n')
+    with pytest.raises(ValueError, match="client_id, client_secret"):
+        load_accounts(config)
+
+
+def test_playlist_song_ids_follow_pagination(spotify: Spotify):
+    spotify.spotify.user_playlist.return_value = {"tracks": playlist_page(["a", "b"], next_page="page_2")}
+    spotify.spotify.next.side_effect = [playlist_page(["c"], next_page="page_3"), playlist_page(["d"])]
+    assert spotify.get_playlist_song_ids("playlist_id") == ["a", "b", "c", "d"]
+    assert spotify.spotify.next.call_count == 2
+
+
+def test_new_songs_added_in_batches(spotify: Spotify):
+    spotify.spotify.user_playlist.return_value = {"tracks": playlist_page(["existing"])}
+    new_song_ids = [f"song_{i}" for i in range(250)]
+    spotify.add_music_to_playlist("playlist_id", ["existing"] + new_song_ids)
+
+    calls = spotify.spotify.user_playlist_add_tracks.call_args_list
+    assert [len(call[0][2]) for call in calls] == [100, 100, 50]
+    assert [song_id for call in calls for song_id in call[0][2]] == new_song_ids
+
+
+def test_no_songs_added_when_all_in_playlist(spotify: Spotify):
+    spotify.spotify.user_playlist.return_value = {"tracks": playlist_page(["a", "b"])}
+    spotify.add_music_to_playlist("playlist_id", ["a", "b"])
+    spotify.spotify.user_playlist_add_tracks.assert_not_called()